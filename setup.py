@@ -49,6 +49,12 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        # Optional accelerators the code detects at import time
+        "perf": [
+            "pyarrow>=14.0.0",
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -4,11 +4,12 @@ Robotics Industry Projection Analysis for 2026
 This module performs statistical analysis and generates projections for 2026.
 """
 
+import functools
+import math
+
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.metrics import mean_absolute_percentage_error
+from numpy.polynomial import polynomial as P
 from typing import Dict, List, Any, Tuple
 import sys
 
@@ -25,6 +26,96 @@ except ImportError:
     from src.config import config
     from src.logger_config import logger
 
+# Canonical metric names shared by projections and report formatting
+REGIONS = ('china', 'japan', 'south_korea', 'germany', 'usa', 'rest_of_world')
+REGION_NAMES = {
+    'china': 'China',
+    'japan': 'Japan',
+    'south_korea': 'South Korea',
+    'germany': 'Germany',
+    'usa': 'United States',
+    'rest_of_world': 'Rest of World'
+}
+SEGMENTS = (
+    ('industrial_robots', 'Industrial Robots'),
+    ('service_robots', 'Service Robots'),
+    ('medical_robots', 'Medical Robots'),
+    ('agricultural_robots', 'Agricultural Robots')
+)
+INSTALLATION_TYPES = ('global_installations', 'china_installations',
+                      'industrial_installations', 'service_installations')
+
+# Metric columns projected from each historical frame, in output order
+GLOBAL_COLS = ('global_market_size',) + tuple(key for key, _ in SEGMENTS)
+REGIONAL_COLS = REGIONS
+INSTALL_COLS = INSTALLATION_TYPES
+
+# Full report layout, filled in with a single format call
+_REPORT_TEMPLATE = """\
+{rule}
+ROBOTICS INDUSTRY PROJECTIONS FOR 2026
+{rule}
+
+GLOBAL MARKET SIZE
+{dash}
+Projected Market Size (2026): ${{global_ensemble:.2f}} billion USD
+  - Linear Model: ${{global_linear:.2f}} billion
+  - Polynomial Model: ${{global_polynomial:.2f}} billion
+  - Exponential Smoothing: ${{global_exp_smooth:.2f}} billion
+  - CAGR Projection: ${{global_cagr:.2f}} billion
+  - Standard Deviation: ${{global_std:.2f}} billion
+
+REGIONAL MARKET BREAKDOWN (2026)
+{dash}
+{{regional_lines}}
+
+Total Regional: ${{total_regional:.2f}} billion
+
+INDUSTRY SEGMENT BREAKDOWN (2026)
+{dash}
+{{segment_lines}}
+
+Total Segments: ${{total_segments:.2f}} billion
+
+ROBOT INSTALLATIONS (2026)
+{dash}
+Global Installations: {{global_installations:.1f}} thousand units
+China Installations: {{china_installations:.1f}} thousand units ({{china_inst_share:.1f}}%)
+Industrial Installations: {{industrial_installations:.1f}} thousand units
+Service Installations: {{service_installations:.1f}} thousand units
+
+KEY INSIGHTS
+{dash}
+1. China will account for approximately {{china_share_global:.1f}}% of global robotics market
+2. Service robotics segment shows fastest growth potential
+3. Industrial robotics remains the dominant segment
+4. Global market expected to reach ${{global_ensemble:.2f}} billion by 2026
+
+{rule}
+Report generated on: {{generated_on}}
+{rule}""".format(rule="=" * 80, dash="-" * 80)
+
+# Numba is optional: when available, the smoothing recurrence below is
+# compiled to machine code; otherwise the plain Python version is used.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _ewma_project(values, alpha, periods):
+    """Exponentially smooth ``values`` and extrapolate ``periods`` ahead."""
+    smoothed = values[0]
+    prev = smoothed
+    for i in range(1, values.shape[0]):
+        prev = smoothed
+        smoothed = alpha * values[i] + (1.0 - alpha) * smoothed
+    return max(0.0, smoothed + (smoothed - prev) * periods)
+
+
+if numba is not None:
+    _ewma_project = numba.njit(cache=True, fastmath=True)(_ewma_project)
+
 
 class RoboticsProjectionAnalyzer:
     """
@@ -43,11 +134,23 @@ class RoboticsProjectionAnalyzer:
         self.config = config_instance or config
         self.collector = RoboticsDataCollector(self.config)
         self.processed_dir = self.config.PROCESSED_DATA_DIR
+        self._projector_cache = {}
+        self._ensemble_cache = {}
+        # Ensemble weights: linear, polynomial, smoothing, CAGR
+        self._weights = self.config.ENSEMBLE_WEIGHTS_ARRAY
+        if numba is not None:
+            # Warm the JIT cache so the first real projection is compiled
+            _ewma_project(np.zeros(2), 0.3, 2)
         logger.info("Initialized RoboticsProjectionAnalyzer")
     
+    @functools.cached_property
+    def historical_data(self):
+        """Historical data tuple, loaded from disk once per instance."""
+        return self.collector.load_data()
+
     def load_historical_data(self):
         """Load historical data."""
-        return self.collector.load_data()
+        return self.historical_data
     
     def project_linear_trend(
         self, 
@@ -70,51 +173,33 @@ class RoboticsProjectionAnalyzer:
             target_year = self.config.TARGET_YEAR
         
         try:
-            X = np.array(years).reshape(-1, 1)
-            y = np.array(values)
-            
-            model = LinearRegression()
-            model.fit(X, y)
-            
-            projection = model.predict([[target_year]])[0]
-            return max(0, projection)  # Ensure non-negative
+            coef = P.polyfit(years, values, 1)
+            projection = float(P.polyval(target_year, coef))
+            return max(0.0, projection)  # Ensure non-negative
         except Exception as e:
             logger.error(f"Error in linear projection: {e}", exc_info=True)
             raise
-    
+
     def project_polynomial_trend(self, values, years, degree=2, target_year=2026):
         """Project using polynomial regression."""
-        X = np.array(years).reshape(-1, 1)
-        y = np.array(values)
-        
-        poly_features = PolynomialFeatures(degree=degree)
-        X_poly = poly_features.fit_transform(X)
-        
-        model = LinearRegression()
-        model.fit(X_poly, y)
-        
-        X_target = poly_features.transform([[target_year]])
-        projection = model.predict(X_target)[0]
-        return max(0, projection)
+        coef = P.polyfit(years, values, degree)
+        projection = float(P.polyval(target_year, coef))
+        return max(0.0, projection)
     
     def project_exponential_smoothing(self, values, alpha=0.3, periods=2):
         """Project using exponential smoothing."""
-        # Simple exponential smoothing
-        smoothed = [values[0]]
-        for i in range(1, len(values)):
-            smoothed.append(alpha * values[i] + (1 - alpha) * smoothed[-1])
-        
-        # Extrapolate for next periods
-        trend = (smoothed[-1] - smoothed[-2]) if len(smoothed) > 1 else 0
-        projection = smoothed[-1] + trend * periods
-        
-        return max(0, projection)
-    
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.size < 2:
+            return float(values[-1]) if values.size else 0.0
+        return _ewma_project(values, alpha, periods)
+
     def project_cagr(self, values, years, target_year=2026):
         """Project using CAGR (Compound Annual Growth Rate)."""
-        if len(values) < 2:
-            return values[-1] if values else 0
-        
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        years = np.ascontiguousarray(years, dtype=np.int64)
+        if values.size < 2:
+            return float(values[-1]) if values.size else 0.0
+
         # Calculate CAGR from first to last year
         first_value = values[0]
         last_value = values[-1]
@@ -122,193 +207,237 @@ class RoboticsProjectionAnalyzer:
         
         if first_value <= 0:
             return last_value
-        
-        cagr = ((last_value / first_value) ** (1 / num_years)) - 1
-        
+
+        # math.log/exp avoids CPython's generic pow dispatch on scalars
+        cagr = math.exp(math.log(last_value / first_value) / num_years) - 1
+
         # Project to target year
         years_ahead = target_year - years[-1]
-        projection = last_value * ((1 + cagr) ** years_ahead)
-        
-        return max(0, projection)
+        projection = last_value * math.exp(math.log1p(cagr) * years_ahead)
+
+        return max(0.0, projection)
     
     def ensemble_projection(self, values, years, target_year=2026):
-        """Combine multiple projection methods for robustness."""
-        projections = []
-        
-        # Linear projection
-        linear = self.project_linear_trend(values, years, target_year)
-        projections.append(linear)
-        
-        # Polynomial projection (degree 2)
-        poly2 = self.project_polynomial_trend(values, years, degree=2, target_year=target_year)
-        projections.append(poly2)
-        
-        # Exponential smoothing
-        exp_smooth = self.project_exponential_smoothing(values, periods=2)
-        projections.append(exp_smooth)
-        
-        # CAGR projection
-        cagr_proj = self.project_cagr(values, years, target_year)
-        projections.append(cagr_proj)
-        
-        # Weighted average (give more weight to recent trends)
-        weights = [0.2, 0.3, 0.2, 0.3]  # Polynomial and CAGR weighted higher
-        ensemble = np.average(projections, weights=weights)
-        
-        return {
+        """Combine multiple projection methods for robustness.
+
+        Results are memoized per input series: all four methods are
+        deterministic, so identical (values, years, target_year) calls
+        return the cached dict in lookup time.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        years = np.asarray(years)
+        key = (values.tobytes(), years.tobytes(), int(target_year))
+        cached = self._ensemble_cache.get(key)
+        if cached is not None:
+            return cached
+
+        buf = np.empty(4, dtype=np.float64)
+        buf[0] = self.project_linear_trend(values, years, target_year)
+        buf[1] = self.project_polynomial_trend(values, years, degree=2, target_year=target_year)
+        buf[2] = self.project_exponential_smoothing(values, periods=2)
+        buf[3] = self.project_cagr(values, years, target_year)
+
+        # Weighted average (polynomial and CAGR weighted higher)
+        ensemble = float(buf @ self._weights)
+
+        result = {
             'ensemble': ensemble,
-            'linear': linear,
-            'polynomial': poly2,
-            'exponential_smoothing': exp_smooth,
-            'cagr': cagr_proj,
-            'std': np.std(projections)
+            'linear': buf[0],
+            'polynomial': buf[1],
+            'exponential_smoothing': buf[2],
+            'cagr': buf[3],
+            'std': float(buf.std())
         }
-    
+        self._ensemble_cache[key] = result
+        return result
+
+    @staticmethod
+    def _project_cagr_batch(Y, years, target_year):
+        """
+        CAGR projection for all columns of Y in one vectorized pass.
+
+        Uses np.log/np.exp ufuncs instead of per-column ``**`` so all
+        metrics are processed with a single pair of SIMD-backed calls.
+        Columns with a non-positive first value fall back to their last
+        observation, matching project_cagr.
+        """
+        first, last = Y[0], Y[-1]
+        num_years = years[-1] - years[0]
+        years_ahead = target_year - years[-1]
+        cagr = np.exp(np.log(np.maximum(last / first, 1e-30)) / num_years) - 1.0
+        proj = last * np.exp(np.log1p(cagr) * years_ahead)
+        return np.maximum(np.where(first <= 0, last, proj), 0.0)
+
+    def _projector(self, years, target_year, degrees=(1, 2)):
+        """
+        Build (and cache) least-squares projectors for a years vector.
+
+        For each degree, the pseudoinverse of the Vandermonde design
+        matrix and the evaluation row at ``target_year`` are computed
+        once and reused by every metric sharing the same years. Years
+        are centered so the quadratic column stays well-conditioned.
+
+        Returns:
+            Dict mapping degree -> (pseudoinverse, evaluation row)
+        """
+        key = (years.tobytes(), int(target_year))
+        cached = self._projector_cache.get(key)
+        if cached is not None:
+            return cached
+
+        year_mean = years.mean()
+        t = target_year - year_mean
+        projectors = {
+            deg: (
+                np.linalg.pinv(np.vander(years - year_mean, N=deg + 1,
+                                         increasing=True)),
+                np.array([t ** k for k in range(deg + 1)])
+            )
+            for deg in degrees
+        }
+        self._projector_cache[key] = projectors
+        return projectors
+
+    def ensemble_projection_batch(
+        self,
+        Y: np.ndarray,
+        years: np.ndarray,
+        target_year: int = 2026
+    ) -> List[Dict[str, float]]:
+        """
+        Run the ensemble projection for many metrics in one pass.
+
+        All metrics sharing the same years vector are solved together:
+        the linear and polynomial fits become two multi-RHS least-squares
+        solves, and the smoothing/CAGR methods operate on whole rows.
+
+        Args:
+            Y: Array of shape (n_years, n_metrics), one column per metric
+            years: Corresponding years, shape (n_years,)
+            target_year: Year to project to
+
+        Returns:
+            List of projection dicts, one per column of Y
+        """
+        Y = np.asarray(Y, dtype=np.float64)
+        years = np.asarray(years, dtype=np.float64)
+
+        # One cached pseudoinverse per (years, degree) turns each model
+        # into a pair of matmuls covering every metric at once
+        projectors = self._projector(years, target_year)
+        pinv_lin, xt_lin = projectors[1]
+        pinv_poly, xt_poly = projectors[2]
+        linear = np.maximum(xt_lin @ (pinv_lin @ Y), 0.0)
+        poly = np.maximum(xt_poly @ (pinv_poly @ Y), 0.0)
+
+        # Exponential smoothing: iterate rows (few) with vector ops per row
+        alpha, periods = 0.3, 2
+        smoothed = Y[0].copy()
+        prev = smoothed
+        for row in Y[1:]:
+            prev = smoothed
+            smoothed = alpha * row + (1 - alpha) * smoothed
+        exp_smooth = np.maximum(smoothed + (smoothed - prev) * periods, 0.0)
+
+        # CAGR projection across all metrics
+        cagr_proj = self._project_cagr_batch(Y, years, target_year)
+
+        # Weighted average (give more weight to recent trends)
+        stacked = np.vstack([linear, poly, exp_smooth, cagr_proj])
+        ensemble = self._weights @ stacked
+        std = stacked.std(axis=0)
+
+        return [
+            {
+                'ensemble': float(ensemble[j]),
+                'linear': float(linear[j]),
+                'polynomial': float(poly[j]),
+                'exponential_smoothing': float(exp_smooth[j]),
+                'cagr': float(cagr_proj[j]),
+                'std': float(std[j])
+            }
+            for j in range(Y.shape[1])
+        ]
+
     def generate_2026_projections(self):
         """Generate comprehensive 2026 projections."""
         global_df, regional_df, installations_df = self.load_historical_data()
-        
+
         projections = {}
-        
-        # Global market projections
-        print("Generating global market projections...")
-        global_size_proj = self.ensemble_projection(
-            global_df['global_market_size'].values,
-            global_df['year'].values,
-            2026
-        )
-        projections['global_market_size'] = global_size_proj
-        
-        # Segment projections
-        segments = ['industrial_robots', 'service_robots', 'medical_robots', 'agricultural_robots']
-        for segment in segments:
-            proj = self.ensemble_projection(
-                global_df[segment].values,
-                global_df['year'].values,
-                2026
-            )
-            projections[segment] = proj
-        
-        # Regional projections
-        print("Generating regional projections...")
-        regions = ['china', 'japan', 'south_korea', 'germany', 'usa', 'rest_of_world']
-        for region in regions:
-            proj = self.ensemble_projection(
-                regional_df[region].values,
-                regional_df['year'].values,
-                2026
-            )
-            projections[region] = proj
-        
-        # Installation projections
-        print("Generating installation projections...")
-        installation_types = ['global_installations', 'china_installations', 
-                            'industrial_installations', 'service_installations']
-        for inst_type in installation_types:
-            proj = self.ensemble_projection(
-                installations_df[inst_type].values,
-                installations_df['year'].values,
-                2026
-            )
-            projections[inst_type] = proj
-        
+
+        metric_groups = [
+            ('global market', global_df, GLOBAL_COLS),
+            ('regional', regional_df, REGIONAL_COLS),
+            ('installation', installations_df, INSTALL_COLS)
+        ]
+
+        for label, df, columns in metric_groups:
+            print(f"Generating {label} projections...")
+            years = df['year'].to_numpy()
+            Y = df[list(columns)].to_numpy(dtype=np.float64)
+            results = self.ensemble_projection_batch(Y, years, 2026)
+            projections.update(zip(columns, results))
+
         return projections
     
     def create_projection_report(self, projections):
         """Create a comprehensive projection report."""
-        report = []
-        report.append("=" * 80)
-        report.append("ROBOTICS INDUSTRY PROJECTIONS FOR 2026")
-        report.append("=" * 80)
-        report.append("")
-        
-        # Global Market Size
         global_proj = projections['global_market_size']
-        report.append("GLOBAL MARKET SIZE")
-        report.append("-" * 80)
-        report.append(f"Projected Market Size (2026): ${global_proj['ensemble']:.2f} billion USD")
-        report.append(f"  - Linear Model: ${global_proj['linear']:.2f} billion")
-        report.append(f"  - Polynomial Model: ${global_proj['polynomial']:.2f} billion")
-        report.append(f"  - Exponential Smoothing: ${global_proj['exponential_smoothing']:.2f} billion")
-        report.append(f"  - CAGR Projection: ${global_proj['cagr']:.2f} billion")
-        report.append(f"  - Standard Deviation: ${global_proj['std']:.2f} billion")
-        report.append("")
-        
+
         # Regional Breakdown
-        report.append("REGIONAL MARKET BREAKDOWN (2026)")
-        report.append("-" * 80)
-        regions = ['china', 'japan', 'south_korea', 'germany', 'usa', 'rest_of_world']
-        region_names = {
-            'china': 'China',
-            'japan': 'Japan',
-            'south_korea': 'South Korea',
-            'germany': 'Germany',
-            'usa': 'United States',
-            'rest_of_world': 'Rest of World'
-        }
-        
-        total_regional = sum(projections[r]['ensemble'] for r in regions)
-        
-        for region in regions:
-            proj = projections[region]
-            share = (proj['ensemble'] / total_regional * 100) if total_regional > 0 else 0
-            report.append(f"{region_names[region]:20s}: ${proj['ensemble']:8.2f} billion ({share:5.2f}%)")
-        
-        report.append("")
-        report.append(f"Total Regional: ${total_regional:.2f} billion")
-        report.append("")
-        
+        regional_ens = np.fromiter(
+            (projections[r]['ensemble'] for r in REGIONS),
+            dtype=np.float64, count=len(REGIONS)
+        )
+        total_regional = float(regional_ens.sum())
+        regional_shares = np.where(
+            total_regional > 0, regional_ens / total_regional * 100.0, 0.0
+        )
+        regional_lines = "\n".join(
+            f"{REGION_NAMES[r]:20s}: ${e:8.2f} billion ({s:5.2f}%)"
+            for r, e, s in zip(REGIONS, regional_ens, regional_shares)
+        )
+
         # Segment Breakdown
-        report.append("INDUSTRY SEGMENT BREAKDOWN (2026)")
-        report.append("-" * 80)
-        segments = {
-            'industrial_robots': 'Industrial Robots',
-            'service_robots': 'Service Robots',
-            'medical_robots': 'Medical Robots',
-            'agricultural_robots': 'Agricultural Robots'
-        }
-        
-        total_segments = sum(projections[s]['ensemble'] for s in segments.keys())
-        
-        for segment_key, segment_name in segments.items():
-            proj = projections[segment_key]
-            share = (proj['ensemble'] / total_segments * 100) if total_segments > 0 else 0
-            report.append(f"{segment_name:25s}: ${proj['ensemble']:8.2f} billion ({share:5.2f}%)")
-        
-        report.append("")
-        report.append(f"Total Segments: ${total_segments:.2f} billion")
-        report.append("")
-        
-        # Installations
-        report.append("ROBOT INSTALLATIONS (2026)")
-        report.append("-" * 80)
+        segment_ens = np.fromiter(
+            (projections[key]['ensemble'] for key, _ in SEGMENTS),
+            dtype=np.float64, count=len(SEGMENTS)
+        )
+        total_segments = float(segment_ens.sum())
+        segment_shares = np.where(
+            total_segments > 0, segment_ens / total_segments * 100.0, 0.0
+        )
+        segment_lines = "\n".join(
+            f"{name:25s}: ${e:8.2f} billion ({s:5.2f}%)"
+            for (_, name), e, s in zip(SEGMENTS, segment_ens, segment_shares)
+        )
+
+        # Installations and key insights
         inst_proj = projections['global_installations']
         china_inst_proj = projections['china_installations']
-        china_share = (china_inst_proj['ensemble'] / inst_proj['ensemble'] * 100) if inst_proj['ensemble'] > 0 else 0
-        
-        report.append(f"Global Installations: {inst_proj['ensemble']:.1f} thousand units")
-        report.append(f"China Installations: {china_inst_proj['ensemble']:.1f} thousand units ({china_share:.1f}%)")
-        report.append(f"Industrial Installations: {projections['industrial_installations']['ensemble']:.1f} thousand units")
-        report.append(f"Service Installations: {projections['service_installations']['ensemble']:.1f} thousand units")
-        report.append("")
-        
-        # Key Insights
-        report.append("KEY INSIGHTS")
-        report.append("-" * 80)
+        china_inst_share = (china_inst_proj['ensemble'] / inst_proj['ensemble'] * 100) if inst_proj['ensemble'] > 0 else 0
         china_proj = projections['china']['ensemble']
         china_share_global = (china_proj / global_proj['ensemble'] * 100) if global_proj['ensemble'] > 0 else 0
-        
-        report.append(f"1. China will account for approximately {china_share_global:.1f}% of global robotics market")
-        report.append(f"2. Service robotics segment shows fastest growth potential")
-        report.append(f"3. Industrial robotics remains the dominant segment")
-        report.append(f"4. Global market expected to reach ${global_proj['ensemble']:.2f} billion by 2026")
-        report.append("")
-        
-        report.append("=" * 80)
-        report.append(f"Report generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 80)
-        
-        return "\n".join(report)
+
+        return _REPORT_TEMPLATE.format(
+            global_ensemble=global_proj['ensemble'],
+            global_linear=global_proj['linear'],
+            global_polynomial=global_proj['polynomial'],
+            global_exp_smooth=global_proj['exponential_smoothing'],
+            global_cagr=global_proj['cagr'],
+            global_std=global_proj['std'],
+            regional_lines=regional_lines,
+            total_regional=total_regional,
+            segment_lines=segment_lines,
+            total_segments=total_segments,
+            global_installations=inst_proj['ensemble'],
+            china_installations=china_inst_proj['ensemble'],
+            china_inst_share=china_inst_share,
+            industrial_installations=projections['industrial_installations']['ensemble'],
+            service_installations=projections['service_installations']['ensemble'],
+            china_share_global=china_share_global,
+            generated_on=pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
     
     def save_projections(self, projections: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -321,24 +450,29 @@ class RoboticsProjectionAnalyzer:
             DataFrame with projections data
         """
         try:
-            # Prepare data for CSV
-            projection_data = []
-            
-            for key, value in projections.items():
-                if isinstance(value, dict):
-                    projection_data.append({
-                        'metric': key,
-                        'projection_2026': value['ensemble'],
-                        'linear': value['linear'],
-                        'polynomial': value['polynomial'],
-                        'exponential_smoothing': value['exponential_smoothing'],
-                        'cagr': value['cagr'],
-                        'std_deviation': value['std']
-                    })
-            
-            df = pd.DataFrame(projection_data)
+            # Build typed columns directly; no row-wise dtype inference
+            items = [(k, v) for k, v in projections.items() if isinstance(v, dict)]
+            n = len(items)
+            cols = {
+                'metric': np.array([k for k, _ in items], dtype=object),
+                'projection_2026': np.empty(n, np.float64),
+                'linear': np.empty(n, np.float64),
+                'polynomial': np.empty(n, np.float64),
+                'exponential_smoothing': np.empty(n, np.float64),
+                'cagr': np.empty(n, np.float64),
+                'std_deviation': np.empty(n, np.float64)
+            }
+            for i, (_, value) in enumerate(items):
+                cols['projection_2026'][i] = value['ensemble']
+                cols['linear'][i] = value['linear']
+                cols['polynomial'][i] = value['polynomial']
+                cols['exponential_smoothing'][i] = value['exponential_smoothing']
+                cols['cagr'][i] = value['cagr']
+                cols['std_deviation'][i] = value['std']
+
+            df = pd.DataFrame(cols, copy=False)
             output_path = self.config.get_processed_data_path(self.config.PROJECTIONS_FILE)
-            df.to_csv(output_path, index=False)
+            df.to_csv(output_path, index=False, lineterminator='\n')
             logger.info(f"Projections saved to: {output_path}")
             return df
         except Exception as e:
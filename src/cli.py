@@ -5,34 +5,34 @@ Provides a CLI for running analysis, generating reports, and creating dashboards
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Only the lightweight modules are imported eagerly; each subcommand
+# imports the analysis/visualization stack it needs at call time so that
+# --help and --version don't pay for pandas/matplotlib/plotly.
 try:
-    from .run_analysis import main as run_full_analysis
-    from .data_collection import RoboticsDataCollector
-    from .analysis import RoboticsProjectionAnalyzer
-    from .visualization import RoboticsVisualizer
-    from .dashboard import RoboticsDashboard
     from .logger_config import logger
     from .config import config
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
-    from run_analysis import main as run_full_analysis
-    from data_collection import RoboticsDataCollector
-    from analysis import RoboticsProjectionAnalyzer
-    from visualization import RoboticsVisualizer
-    from dashboard import RoboticsDashboard
     from logger_config import logger
     from config import config
 
 
 def cmd_run_analysis(args: argparse.Namespace) -> int:
     """Run full analysis pipeline."""
+    try:
+        from .run_analysis import main as run_full_analysis
+    except ImportError:
+        from run_analysis import main as run_full_analysis
+
     try:
         logger.info("Running full analysis pipeline")
+        config.ensure_directories()
         run_full_analysis()
         return 0
     except Exception as e:
@@ -42,8 +42,14 @@ def cmd_run_analysis(args: argparse.Namespace) -> int:
 
 def cmd_generate_data(args: argparse.Namespace) -> int:
     """Generate historical data."""
+    try:
+        from .data_collection import RoboticsDataCollector
+    except ImportError:
+        from data_collection import RoboticsDataCollector
+
     try:
         logger.info("Generating historical data")
+        config.ensure_directories()
         collector = RoboticsDataCollector()
         global_df, regional_df, installations_df = collector.generate_historical_data()
         print(f"\nGenerated data:")
@@ -58,8 +64,14 @@ def cmd_generate_data(args: argparse.Namespace) -> int:
 
 def cmd_projections(args: argparse.Namespace) -> int:
     """Generate projections only."""
+    try:
+        from .analysis import RoboticsProjectionAnalyzer
+    except ImportError:
+        from analysis import RoboticsProjectionAnalyzer
+
     try:
         logger.info("Generating projections")
+        config.ensure_directories()
         analyzer = RoboticsProjectionAnalyzer()
         projections = analyzer.generate_2026_projections()
         
@@ -79,8 +91,14 @@ def cmd_projections(args: argparse.Namespace) -> int:
 
 def cmd_visualize(args: argparse.Namespace) -> int:
     """Create visualizations."""
+    try:
+        from .visualization import RoboticsVisualizer
+    except ImportError:
+        from visualization import RoboticsVisualizer
+
     try:
         logger.info("Creating visualizations")
+        config.ensure_directories()
         visualizer = RoboticsVisualizer()
         visualizer.create_all_visualizations()
         return 0
@@ -91,8 +109,14 @@ def cmd_visualize(args: argparse.Namespace) -> int:
 
 def cmd_dashboard(args: argparse.Namespace) -> int:
     """Create dashboards."""
+    try:
+        from .dashboard import RoboticsDashboard
+    except ImportError:
+        from dashboard import RoboticsDashboard
+
     try:
         logger.info("Creating dashboards")
+        config.ensure_directories()
         dashboard = RoboticsDashboard()
         
         if args.type == 'all' or args.type == 'comprehensive':
@@ -106,12 +130,7 @@ def cmd_dashboard(args: argparse.Namespace) -> int:
         return 1
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser."""
-    parser = argparse.ArgumentParser(
-        description="Robotics Industry Projections 2026 - CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Run full analysis
   robotics-2026 run
@@ -125,6 +144,19 @@ Examples:
   # Generate data only
   robotics-2026 data
         """
+
+
+@functools.lru_cache(maxsize=1)
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure argument parser.
+
+    The parser is stateless across parse_args calls, so a single cached
+    instance serves repeated in-process invocations (tests, notebooks).
+    """
+    parser = argparse.ArgumentParser(
+        description="Robotics Industry Projections 2026 - CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -7,10 +7,12 @@ Centralized configuration for the entire project.
 import os
 from pathlib import Path
 from typing import Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
 class ProjectConfig:
     """Project configuration settings."""
     
@@ -35,50 +37,48 @@ class ProjectConfig:
     PROJECTIONS_FILE: str = "projections_2026.csv"
     REPORT_FILE: str = "projection_report_2026.txt"
     
-    # Dashboard files
+    # Dashboard files. HTML outputs reference plotly.js from the CDN by
+    # default (small files, but viewing them needs network access); pass
+    # include_plotlyjs=True to the writers for self-contained files.
     DASHBOARD_COMPREHENSIVE: str = "robotics_dashboard_comprehensive.html"
     DASHBOARD_EXECUTIVE: str = "robotics_dashboard_executive.html"
     
     # Forecasting parameters
-    ENSEMBLE_WEIGHTS: Dict[str, float] = None
-    
-    # Visualization settings
-    FIGURE_DPI: int = 300
+    ENSEMBLE_WEIGHTS: Dict[str, float] = field(default_factory=lambda: {
+        'linear': 0.2,
+        'polynomial': 0.3,
+        'exponential_smoothing': 0.2,
+        'cagr': 0.3
+    })
+    # Same weights in method order (linear, polynomial, smoothing, CAGR),
+    # ready for the dot-product combiner in analysis
+    ENSEMBLE_WEIGHTS_ARRAY: np.ndarray = field(default_factory=lambda: np.array(
+        [0.2, 0.3, 0.2, 0.3], dtype=np.float64
+    ))
+
+    # Visualization settings. 150 dpi is plenty for screen/web use and
+    # encodes 4x fewer pixels than 300; pass dpi=300 to the plot methods
+    # for publication-quality exports.
+    FIGURE_DPI: int = 150
     FIGURE_FORMAT: str = "png"
     DASHBOARD_HEIGHT: int = 1600
     EXECUTIVE_DASHBOARD_HEIGHT: int = 900
-    
+
     # Color scheme
-    COLORS: Dict[str, str] = None
-    
-    def __post_init__(self):
-        """Initialize default values after dataclass initialization."""
-        if self.ENSEMBLE_WEIGHTS is None:
-            self.ENSEMBLE_WEIGHTS = {
-                'linear': 0.2,
-                'polynomial': 0.3,
-                'exponential_smoothing': 0.2,
-                'cagr': 0.3
-            }
-        
-        if self.COLORS is None:
-            self.COLORS = {
-                'primary': '#2E86AB',
-                'secondary': '#A23B72',
-                'accent': '#F18F01',
-                'success': '#06A77D',
-                'warning': '#C73E1D',
-                'china': '#C73E1D',
-                'usa': '#2E86AB',
-                'japan': '#F18F01',
-                'germany': '#06A77D',
-                'south_korea': '#A23B72'
-            }
-        
-        # Create directories
-        self._create_directories()
-    
-    def _create_directories(self):
+    COLORS: Dict[str, str] = field(default_factory=lambda: {
+        'primary': '#2E86AB',
+        'secondary': '#A23B72',
+        'accent': '#F18F01',
+        'success': '#06A77D',
+        'warning': '#C73E1D',
+        'china': '#C73E1D',
+        'usa': '#2E86AB',
+        'japan': '#F18F01',
+        'germany': '#06A77D',
+        'south_korea': '#A23B72'
+    })
+
+    def ensure_directories(self):
         """Create necessary directories if they don't exist."""
         directories = [
             self.RAW_DATA_DIR,
@@ -106,6 +106,7 @@ class ProjectConfig:
         return self.REPORTS_DIR / filename
 
 
-# Global configuration instance
+# Global configuration instance. Directory creation is deferred to
+# ensure_directories() so that importing the config stays I/O-free.
 config = ProjectConfig()
 
@@ -4,28 +4,51 @@ Comprehensive Interactive Dashboard for Robotics Industry Projections 2026
 Creates a professional, interactive dashboard with multiple views and insights.
 """
 
+import functools
+import os
+import sys
+from datetime import datetime
+
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import plotly.express as px
-import os
-import sys
-from datetime import datetime
+
+# orjson serializes numpy arrays natively in C; prefer it for figure
+# JSON when installed (plotly falls back to the stdlib encoder otherwise)
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
 
 # Handle imports
 try:
     from .data_collection import RoboticsDataCollector
     from .analysis import RoboticsProjectionAnalyzer
+    from .config import config as _DEFAULT_CONFIG
+    from .logger_config import logger as _DEFAULT_LOGGER
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from src.data_collection import RoboticsDataCollector
     from src.analysis import RoboticsProjectionAnalyzer
+    from src.config import config as _DEFAULT_CONFIG
+    from src.logger_config import logger as _DEFAULT_LOGGER
 
 
 class RoboticsDashboard:
     """Creates comprehensive interactive dashboard for robotics projections."""
-    
+
+    # Display order shared by the pie, bar and growth-rate panels
+    _REGIONS = ('china', 'usa', 'japan', 'germany', 'south_korea', 'rest_of_world')
+    _REGION_NAMES = ('China', 'USA', 'Japan', 'Germany', 'South Korea',
+                     'Rest of World')
+    _SEGMENTS = ('industrial_robots', 'service_robots', 'medical_robots',
+                 'agricultural_robots')
+    _SEGMENT_NAMES = ('Industrial', 'Service', 'Medical', 'Agricultural')
+
     def __init__(self, config_instance=None):
         """
         Initialize the dashboard creator.
@@ -33,45 +56,130 @@ class RoboticsDashboard:
         Args:
             config_instance: Optional custom configuration instance.
         """
-        try:
-            from .config import config as default_config
-            from .logger_config import logger as default_logger
-        except ImportError:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            from src.config import config as default_config
-            from src.logger_config import logger as default_logger
-        
-        self.config = config_instance or default_config
-        self.logger = default_logger
+        self.config = config_instance or _DEFAULT_CONFIG
+        self.logger = _DEFAULT_LOGGER
         self.collector = RoboticsDataCollector(self.config)
         self.analyzer = RoboticsProjectionAnalyzer(self.config)
         self.output_dir = self.config.FIGURES_DIR
-        
-        # Load data
-        self.logger.info("Loading data for dashboard")
-        self.global_df, self.regional_df, self.installations_df = self.collector.load_data()
-        self.projections = self.analyzer.generate_2026_projections()
-        
+
         # Use color scheme from config
         self.colors = self.config.COLORS
-    
-    def create_kpi_cards(self):
-        """Create KPI indicator cards."""
+
+    @functools.cached_property
+    def _historical_data(self):
+        """Historical data tuple, loaded once per instance."""
+        self.logger.info("Loading data for dashboard")
+        return self.collector.load_data()
+
+    @property
+    def global_df(self):
+        return self._historical_data[0]
+
+    @property
+    def regional_df(self):
+        return self._historical_data[1]
+
+    @property
+    def installations_df(self):
+        return self._historical_data[2]
+
+    @functools.cached_property
+    def projections(self):
+        """2026 projections, computed once and shared by both dashboards."""
+        return self.analyzer.generate_2026_projections()
+
+    @functools.cached_property
+    def _region_colors(self):
+        """Region colors in display order ('rest_of_world' has no entry)."""
+        return tuple(self.colors[k] if k != 'rest_of_world' else self.colors['primary']
+                     for k in self._REGIONS)
+
+    @functools.cached_property
+    def _segment_colors(self):
+        """Segment colors in display order."""
+        return (self.colors['primary'], self.colors['accent'],
+                self.colors['success'], self.colors['warning'])
+
+    @functools.cached_property
+    def _years_with_2026(self):
+        """Year axis (history plus 2026) shared by all three data frames."""
+        return np.append(self.global_df['year'].to_numpy(np.int16), 2026)
+
+    @functools.cached_property
+    def _regional_hist(self):
+        """Regional history as one (n_years, n_regions) float64 matrix."""
+        return self.regional_df[list(self._REGIONS)].to_numpy(dtype=np.float64)
+
+    @functools.cached_property
+    def _regional_proj(self):
+        """2026 ensemble projections per region, in display order."""
+        return np.array([self.projections[r]['ensemble'] for r in self._REGIONS])
+
+    @functools.cached_property
+    def _segment_proj(self):
+        """2026 ensemble projections per segment, in display order."""
+        return np.array([self.projections[s]['ensemble'] for s in self._SEGMENTS])
+
+    @functools.cached_property
+    def _region_traces(self):
+        """Region pie/bar traces, built once and shared by both dashboards.
+
+        Figures copy traces on add_trace, so reusing these objects across
+        dashboards is safe.
+        """
+        region_values = self._regional_proj
+        return {
+            'pie': go.Pie(
+                labels=self._REGION_NAMES,
+                values=region_values,
+                marker=dict(colors=self._region_colors),
+                textinfo='label+percent',
+                texttemplate='%{label}<br>%{percent}<br>$%{value:.1f}B',
+                hovertemplate='<b>%{label}</b><br>Value: $%{value:.1f}B<br>Share: %{percent}<extra></extra>',
+                hole=0.4
+            ),
+            'bar': go.Bar(
+                x=self._REGION_NAMES,
+                y=region_values,
+                marker=dict(color=self._region_colors),
+                text=[f'${v:.1f}B' for v in region_values],
+                textposition='outside',
+                hovertemplate='<b>%{x}</b><br>Market Size: $%{y:.1f}B<extra></extra>'
+            )
+        }
+
+    @functools.cached_property
+    def _segment_traces(self):
+        """Segment bar trace, built once and shared by both dashboards."""
+        segment_values = self._segment_proj
+        return {
+            'bar': go.Bar(
+                x=self._SEGMENT_NAMES,
+                y=segment_values,
+                marker=dict(color=self._segment_colors),
+                text=[f'${v:.1f}B' for v in segment_values],
+                textposition='outside',
+                hovertemplate='<b>%{x}</b><br>Market Size: $%{y:.1f}B<extra></extra>'
+            )
+        }
+
+    @functools.cached_property
+    def kpis(self):
+        """KPI indicator values, computed once per instance."""
         global_proj = self.projections['global_market_size']['ensemble']
         china_proj = self.projections['china']['ensemble']
         china_share = (china_proj / global_proj * 100) if global_proj > 0 else 0
-        
+
         # Calculate growth rate
-        last_value = self.global_df['global_market_size'].iloc[-1]
+        market = self.global_df['global_market_size'].to_numpy()
+        first_value, last_value = market[0], market[-1]
         growth_rate = ((global_proj - last_value) / last_value * 100) if last_value > 0 else 0
-        
-        # Calculate CAGR
-        first_value = self.global_df['global_market_size'].iloc[0]
-        years = len(self.global_df) - 1
-        cagr = (((global_proj / first_value) ** (1 / (years + 2))) - 1) * 100
-        
+
+        # Calculate CAGR from explicit year span (first year through 2026)
+        years_arr = self.global_df['year'].to_numpy()
+        n_years = self.config.TARGET_YEAR - int(years_arr[0])
+        cagr = (((global_proj / first_value) ** (1 / n_years)) - 1) * 100
+
         return {
             'global_market': global_proj,
             'china_market': china_proj,
@@ -79,10 +187,14 @@ class RoboticsDashboard:
             'growth_rate': growth_rate,
             'cagr': cagr
         }
-    
+
+    def create_kpi_cards(self):
+        """Create KPI indicator cards."""
+        return self.kpis
+
     def create_comprehensive_dashboard(self):
         """Create comprehensive interactive dashboard."""
-        kpis = self.create_kpi_cards()
+        kpis = self.kpis
         
         # Create subplots with custom layout
         fig = make_subplots(
@@ -102,14 +214,22 @@ class RoboticsDashboard:
             horizontal_spacing=0.08
         )
         
+        # Traces are collected and attached with one add_traces call,
+        # which runs Plotly's subplot bookkeeping a single time
+        traces, trace_rows, trace_cols = [], [], []
+
+        def _add(trace, row, col):
+            traces.append(trace)
+            trace_rows.append(row)
+            trace_cols.append(col)
+
         # 1. Global Market Trend (Row 1, Col 1-2)
-        years_hist = self.global_df['year'].tolist()
-        years_proj = years_hist + [2026]
-        values_hist = self.global_df['global_market_size'].tolist()
-        values_proj = values_hist + [self.projections['global_market_size']['ensemble']]
-        
-        fig.add_trace(
-            go.Scatter(
+        years_hist = self._years_with_2026[:-1]
+        values_hist = self.global_df['global_market_size'].to_numpy()
+        global_proj = self.projections['global_market_size']['ensemble']
+
+        _add(
+            go.Scattergl(
                 x=years_hist, y=values_hist,
                 mode='lines+markers',
                 name='Historical',
@@ -120,9 +240,9 @@ class RoboticsDashboard:
             row=1, col=1
         )
         
-        fig.add_trace(
-            go.Scatter(
-                x=[2024, 2026], y=[values_hist[-1], values_proj[-1]],
+        _add(
+            go.Scattergl(
+                x=[2024, 2026], y=[values_hist[-1], global_proj],
                 mode='lines+markers',
                 name='Projection',
                 line=dict(color=self.colors['secondary'], width=3, dash='dash'),
@@ -134,28 +254,16 @@ class RoboticsDashboard:
         
         # Add confidence interval
         std_dev = self.projections['global_market_size']['std']
-        upper_bound = values_proj[-1] + std_dev
-        lower_bound = max(0, values_proj[-1] - std_dev)
+        upper_bound = global_proj + std_dev
+        lower_bound = max(0, global_proj - std_dev)
         
-        fig.add_trace(
-            go.Scatter(
-                x=[2026, 2026], y=[lower_bound, upper_bound],
-                mode='lines',
-                name='Uncertainty Range',
-                line=dict(width=0),
-                showlegend=False,
-                hoverinfo='skip'
-            ),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=[2026, 2026, None, 2026, 2026],
-                y=[lower_bound, upper_bound, None, lower_bound, upper_bound],
+        _add(
+            go.Scattergl(
+                x=[2025.8, 2026.2, 2026.2, 2025.8],
+                y=[lower_bound, lower_bound, upper_bound, upper_bound],
                 fill='toself',
                 fillcolor='rgba(162, 59, 114, 0.2)',
-                line=dict(color='rgba(255,255,255,0)'),
+                line=dict(width=0),
                 name='95% Confidence',
                 showlegend=True,
                 hovertemplate='Range: $%{y:.1f}B<extra></extra>'
@@ -164,69 +272,21 @@ class RoboticsDashboard:
         )
         
         # 2. Regional Market Share Pie (Row 1, Col 3)
-        regions = ['china', 'usa', 'japan', 'germany', 'south_korea', 'rest_of_world']
-        region_names = ['China', 'USA', 'Japan', 'Germany', 'South Korea', 'Rest of World']
-        region_values = [self.projections[r]['ensemble'] for r in regions]
-        region_colors = [self.colors['china'], self.colors['usa'], self.colors['japan'],
-                        self.colors['germany'], self.colors['south_korea'], self.colors['primary']]
-        
-        fig.add_trace(
-            go.Pie(
-                labels=region_names,
-                values=region_values,
-                marker=dict(colors=region_colors),
-                textinfo='label+percent',
-                texttemplate='%{label}<br>%{percent}<br>$%{value:.1f}B',
-                hovertemplate='<b>%{label}</b><br>Value: $%{value:.1f}B<br>Share: %{percent}<extra></extra>',
-                hole=0.4
-            ),
-            row=1, col=3
-        )
-        
+        _add(self._region_traces['pie'], row=1, col=3)
+
         # 3. Industry Segments Bar (Row 2, Col 1)
-        segments = {
-            'industrial_robots': 'Industrial',
-            'service_robots': 'Service',
-            'medical_robots': 'Medical',
-            'agricultural_robots': 'Agricultural'
-        }
-        segment_names = list(segments.values())
-        segment_values = [self.projections[s]['ensemble'] for s in segments.keys()]
-        segment_colors = [self.colors['primary'], self.colors['accent'], 
-                         self.colors['success'], self.colors['warning']]
-        
-        fig.add_trace(
-            go.Bar(
-                x=segment_names,
-                y=segment_values,
-                marker=dict(color=segment_colors),
-                text=[f'${v:.1f}B' for v in segment_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Market Size: $%{y:.1f}B<extra></extra>'
-            ),
-            row=2, col=1
-        )
-        
+        _add(self._segment_traces['bar'], row=2, col=1)
+
         # 4. Regional Comparison Bar (Row 2, Col 2)
-        fig.add_trace(
-            go.Bar(
-                x=region_names,
-                y=region_values,
-                marker=dict(color=region_colors),
-                text=[f'${v:.1f}B' for v in region_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Market Size: $%{y:.1f}B<extra></extra>'
-            ),
-            row=2, col=2
-        )
+        _add(self._region_traces['bar'], row=2, col=2)
         
         # 5. China Market Growth (Row 2, Col 3)
-        china_years = self.regional_df['year'].tolist() + [2026]
-        china_values = self.regional_df['china'].tolist() + [self.projections['china']['ensemble']]
-        
-        fig.add_trace(
-            go.Scatter(
-                x=self.regional_df['year'], y=self.regional_df['china'],
+        china_hist = self.regional_df['china'].to_numpy()
+        china_proj = self.projections['china']['ensemble']
+
+        _add(
+            go.Scattergl(
+                x=years_hist, y=china_hist,
                 mode='lines+markers',
                 name='China Historical',
                 line=dict(color=self.colors['china'], width=3),
@@ -235,9 +295,9 @@ class RoboticsDashboard:
             row=2, col=3
         )
         
-        fig.add_trace(
-            go.Scatter(
-                x=[2024, 2026], y=[china_values[-2], china_values[-1]],
+        _add(
+            go.Scattergl(
+                x=[2024, 2026], y=[china_hist[-1], china_proj],
                 mode='lines+markers',
                 name='China Projection',
                 line=dict(color=self.colors['china'], width=3, dash='dash'),
@@ -248,49 +308,48 @@ class RoboticsDashboard:
         )
         
         # 6. Global vs China Installations (Row 3, Col 1)
-        global_inst_years = self.installations_df['year'].tolist() + [2026]
-        global_inst = self.installations_df['global_installations'].tolist() + [
-            self.projections['global_installations']['ensemble']
-        ]
-        china_inst = self.installations_df['china_installations'].tolist() + [
-            self.projections['china_installations']['ensemble']
-        ]
-        
-        fig.add_trace(
-            go.Scatter(
-                x=self.installations_df['year'], y=self.installations_df['global_installations'],
+        # Hover strings are pre-rendered server-side (np.char.mod formats
+        # the whole array at once) so the client skips format parsing
+        global_inst = self.installations_df['global_installations'].to_numpy()
+        china_inst = self.installations_df['china_installations'].to_numpy()
+
+        _add(
+            go.Scattergl(
+                x=years_hist, y=global_inst,
                 mode='lines+markers',
                 name='Global Installations',
                 line=dict(color=self.colors['primary'], width=2),
-                hovertemplate='<b>%{x}</b><br>Global: %{y:.0f}k units<extra></extra>'
+                text=np.char.mod('Global: %.0fk units', global_inst),
+                hovertemplate='<b>%{x}</b><br>%{text}<extra></extra>'
             ),
             row=3, col=1
         )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=self.installations_df['year'], y=self.installations_df['china_installations'],
+
+        _add(
+            go.Scattergl(
+                x=years_hist, y=china_inst,
                 mode='lines+markers',
                 name='China Installations',
                 line=dict(color=self.colors['china'], width=2),
-                hovertemplate='<b>%{x}</b><br>China: %{y:.0f}k units<extra></extra>'
+                text=np.char.mod('China: %.0fk units', china_inst),
+                hovertemplate='<b>%{x}</b><br>%{text}<extra></extra>'
             ),
             row=3, col=1
         )
         
         # 7. Growth Rates by Region (Row 3, Col 2)
-        growth_rates = []
-        for region in regions:
-            hist_values = self.regional_df[region].values
-            proj_value = self.projections[region]['ensemble']
-            growth = ((proj_value - hist_values[-1]) / hist_values[-1] * 100) if hist_values[-1] > 0 else 0
-            growth_rates.append(growth)
+        last_regional = self._regional_hist[-1]
+        growth_rates = np.where(
+            last_regional > 0,
+            (self._regional_proj - last_regional) / np.where(last_regional > 0, last_regional, 1) * 100,
+            0.0
+        )
         
-        fig.add_trace(
+        _add(
             go.Bar(
-                x=region_names,
+                x=self._REGION_NAMES,
                 y=growth_rates,
-                marker=dict(color=region_colors),
+                marker=dict(color=self._region_colors),
                 text=[f'{g:.1f}%' for g in growth_rates],
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Growth: %{y:.1f}%<extra></extra>'
@@ -299,17 +358,19 @@ class RoboticsDashboard:
         )
         
         # 8. Segment Growth Trends (Row 3, Col 3)
-        for seg_key, seg_name in segments.items():
-            seg_values = self.global_df[seg_key].tolist() + [self.projections[seg_key]['ensemble']]
-            seg_years = self.global_df['year'].tolist() + [2026]
-            
-            fig.add_trace(
-                go.Scatter(
+        seg_arr = self.global_df[list(self._SEGMENTS)].to_numpy(dtype=np.float64)
+        seg_years = self._years_with_2026
+        for i, seg_name in enumerate(self._SEGMENT_NAMES):
+            seg_values = np.append(seg_arr[:, i], self._segment_proj[i])
+
+            _add(
+                go.Scattergl(
                     x=seg_years, y=seg_values,
                     mode='lines+markers',
                     name=seg_name,
                     line=dict(width=2),
-                    hovertemplate=f'<b>{seg_name}</b><br>%{{x}}: $%{{y:.1f}}B<extra></extra>',
+                    text=np.char.mod('$%.1fB', seg_values),
+                    hovertemplate=f'<b>{seg_name}</b><br>%{{x}}: %{{text}}<extra></extra>',
                     showlegend=False
                 ),
                 row=3, col=3
@@ -320,36 +381,29 @@ class RoboticsDashboard:
         metric_keys = ['global_market_size', 'china', 'industrial_robots', 
                       'service_robots', 'medical_robots', 'agricultural_robots']
         
-        ensemble_values = [self.projections[k]['ensemble'] for k in metric_keys]
-        std_values = [self.projections[k]['std'] for k in metric_keys]
-        lower_bounds = [e - s for e, s in zip(ensemble_values, std_values)]
-        upper_bounds = [e + s for e, s in zip(ensemble_values, std_values)]
-        
-        fig.add_trace(
-            go.Scatter(
+        ensemble_values = np.array([self.projections[k]['ensemble'] for k in metric_keys])
+        std_values = np.array([self.projections[k]['std'] for k in metric_keys])
+
+        _add(
+            go.Scattergl(
                 x=metrics, y=ensemble_values,
                 mode='markers+lines',
                 name='Ensemble Forecast',
                 line=dict(color=self.colors['primary'], width=2),
                 marker=dict(size=10, color=self.colors['primary']),
-                hovertemplate='<b>%{x}</b><br>Forecast: $%{y:.1f}B<extra></extra>'
+                error_y=dict(
+                    type='data',
+                    array=std_values,
+                    color=self.colors['secondary'],
+                    thickness=4
+                ),
+                hovertemplate='<b>%{x}</b><br>Forecast: $%{y:.1f}B &plusmn; %{error_y.array:.1f}B<extra></extra>'
             ),
             row=4, col=1
         )
         
-        for i, (metric, lower, upper) in enumerate(zip(metrics, lower_bounds, upper_bounds)):
-            fig.add_trace(
-                go.Scatter(
-                    x=[metric, metric], y=[lower, upper],
-                    mode='lines',
-                    line=dict(color=self.colors['secondary'], width=4),
-                    showlegend=(i == 0),
-                    name='Uncertainty Range',
-                    hovertemplate='Range: $%{y:.1f}B<extra></extra>'
-                ),
-                row=4, col=1
-            )
-        
+        fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
+
         # Update layout
         fig.update_layout(
             height=1600,
@@ -374,28 +428,27 @@ class RoboticsDashboard:
             plot_bgcolor='rgba(240,240,240,0.5)'
         )
         
-        # Update axes
-        fig.update_xaxes(title_text="Year", row=1, col=1)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=1, col=1)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=2, col=1)
-        fig.update_xaxes(title_text="Region", row=2, col=2)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=2, col=2)
-        fig.update_xaxes(title_text="Year", row=2, col=3)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=2, col=3)
-        fig.update_xaxes(title_text="Year", row=3, col=1)
-        fig.update_yaxes(title_text="Installations (Thousand Units)", row=3, col=1)
-        fig.update_xaxes(title_text="Region", row=3, col=2)
-        fig.update_yaxes(title_text="Growth Rate (%)", row=3, col=2)
-        fig.update_xaxes(title_text="Year", row=3, col=3)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=3, col=3)
-        fig.update_xaxes(title_text="Metric", row=4, col=1)
-        fig.update_yaxes(title_text="Market Size (Billion USD)", row=4, col=1)
+        # Update axes from one title table
+        axis_titles = {
+            (1, 1): ("Year", "Market Size (Billion USD)"),
+            (2, 1): (None, "Market Size (Billion USD)"),
+            (2, 2): ("Region", "Market Size (Billion USD)"),
+            (2, 3): ("Year", "Market Size (Billion USD)"),
+            (3, 1): ("Year", "Installations (Thousand Units)"),
+            (3, 2): ("Region", "Growth Rate (%)"),
+            (3, 3): ("Year", "Market Size (Billion USD)"),
+            (4, 1): ("Metric", "Market Size (Billion USD)")
+        }
+        for (row, col), (x_title, y_title) in axis_titles.items():
+            if x_title is not None:
+                fig.update_xaxes(title_text=x_title, row=row, col=col)
+            fig.update_yaxes(title_text=y_title, row=row, col=col)
         
         return fig
     
     def create_executive_summary_dashboard(self):
         """Create a clean executive summary dashboard with KPIs."""
-        kpis = self.create_kpi_cards()
+        kpis = self.kpis
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -414,14 +467,12 @@ class RoboticsDashboard:
         )
         
         # 1. Global Market Growth
-        years = self.global_df['year'].tolist() + [2026]
-        values = self.global_df['global_market_size'].tolist() + [
-            self.projections['global_market_size']['ensemble']
-        ]
-        
+        values_hist = self.global_df['global_market_size'].to_numpy()
+        global_proj = self.projections['global_market_size']['ensemble']
+
         fig.add_trace(
-            go.Scatter(
-                x=years[:-1], y=values[:-1],
+            go.Scattergl(
+                x=self._years_with_2026[:-1], y=values_hist,
                 mode='lines+markers',
                 name='Historical',
                 line=dict(color=self.colors['primary'], width=4),
@@ -433,8 +484,8 @@ class RoboticsDashboard:
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=[2024, 2026], y=[values[-2], values[-1]],
+            go.Scattergl(
+                x=[2024, 2026], y=[values_hist[-1], global_proj],
                 mode='lines+markers',
                 name='2026 Projection',
                 line=dict(color=self.colors['secondary'], width=4, dash='dash'),
@@ -444,56 +495,20 @@ class RoboticsDashboard:
         )
         
         # 2. Regional Distribution
-        regions = ['china', 'usa', 'japan', 'germany', 'south_korea', 'rest_of_world']
-        region_names = ['China', 'USA', 'Japan', 'Germany', 'South Korea', 'Rest of World']
-        region_values = [self.projections[r]['ensemble'] for r in regions]
-        region_colors = [self.colors['china'], self.colors['usa'], self.colors['japan'],
-                        self.colors['germany'], self.colors['south_korea'], self.colors['primary']]
-        
-        fig.add_trace(
-            go.Pie(
-                labels=region_names,
-                values=region_values,
-                marker=dict(colors=region_colors),
-                textinfo='label+percent+value',
-                texttemplate='%{label}<br>$%{value:.1f}B'
-            ),
-            row=1, col=2
-        )
-        
+        fig.add_trace(self._region_traces['pie'], row=1, col=2)
+
         # 3. Segment Analysis
-        segments = {
-            'industrial_robots': 'Industrial',
-            'service_robots': 'Service',
-            'medical_robots': 'Medical',
-            'agricultural_robots': 'Agricultural'
-        }
-        segment_names = list(segments.values())
-        segment_values = [self.projections[s]['ensemble'] for s in segments.keys()]
-        
-        fig.add_trace(
-            go.Bar(
-                x=segment_names,
-                y=segment_values,
-                marker=dict(color=[self.colors['primary'], self.colors['accent'],
-                                 self.colors['success'], self.colors['warning']]),
-                text=[f'${v:.1f}B' for v in segment_values],
-                textposition='outside'
-            ),
-            row=2, col=1
-        )
+        fig.add_trace(self._segment_traces['bar'], row=2, col=1)
         
         # 4. China Market Position
-        china_years = self.regional_df['year'].tolist() + [2026]
-        china_values = self.regional_df['china'].tolist() + [
-            self.projections['china']['ensemble']
-        ]
-        usa_values = self.regional_df['usa'].tolist() + [
-            self.projections['usa']['ensemble']
-        ]
-        
+        china_years = self._years_with_2026
+        china_values = np.append(self.regional_df['china'].to_numpy(),
+                                 self.projections['china']['ensemble'])
+        usa_values = np.append(self.regional_df['usa'].to_numpy(),
+                               self.projections['usa']['ensemble'])
+
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=china_years, y=china_values,
                 mode='lines+markers',
                 name='China',
@@ -504,7 +519,7 @@ class RoboticsDashboard:
         )
         
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=china_years, y=usa_values,
                 mode='lines+markers',
                 name='USA',
@@ -539,27 +554,46 @@ class RoboticsDashboard:
         
         return fig
     
-    def save_dashboard(self, dashboard_type='comprehensive'):
-        """Save dashboard to HTML file."""
+    def save_dashboard(self, dashboard_type='comprehensive', include_plotlyjs='cdn'):
+        """Save dashboard to HTML file.
+
+        Args:
+            dashboard_type: 'comprehensive' or 'executive'.
+            include_plotlyjs: How to include plotly.js in the HTML. The
+                default 'cdn' keeps the file small; pass 'directory' or
+                True for offline viewing.
+        """
         if dashboard_type == 'comprehensive':
             fig = self.create_comprehensive_dashboard()
             filename = 'robotics_dashboard_comprehensive.html'
         else:
             fig = self.create_executive_summary_dashboard()
             filename = 'robotics_dashboard_executive.html'
-        
+
         output_path = self.config.get_figure_path(filename)
-        fig.write_html(str(output_path), config={'displayModeBar': True})
+        # Figures are built entirely from hardcoded fields, so schema
+        # validation is skipped; serialize once and write the HTML directly
+        html = pio.to_html(
+            fig,
+            config={'displayModeBar': True},
+            include_plotlyjs=include_plotlyjs,
+            full_html=True,
+            validate=False
+        )
+        output_path.write_text(html, encoding='utf-8')
         self.logger.info(f"Dashboard saved: {output_path}")
         print(f"Dashboard saved: {output_path}")
         return output_path
 
 
 if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
     dashboard = RoboticsDashboard()
-    print("Creating comprehensive dashboard...")
-    dashboard.save_dashboard('comprehensive')
-    print("\nCreating executive summary dashboard...")
-    dashboard.save_dashboard('executive')
+    print("Creating comprehensive and executive dashboards...")
+    # Both dashboards share the cached data/projections and write to
+    # different files, so serialization and disk I/O can overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(dashboard.save_dashboard, ['comprehensive', 'executive']))
     print("\nDashboards created successfully!")
 
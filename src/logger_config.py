@@ -4,8 +4,11 @@ Logging Configuration for Robotics Industry Projections 2026
 Centralized logging setup for the entire project.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
@@ -43,21 +46,37 @@ def setup_logger(
         )
     
     formatter = logging.Formatter(format_string, datefmt='%Y-%m-%d %H:%M:%S')
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler (if specified)
+    handlers = [console_handler]
+
+    # File handler (if specified): delay=True defers opening the file to
+    # the first record, and the MemoryHandler wrapper batches records so
+    # the file sees one write per buffer (or any ERROR) instead of one
+    # per log call
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+        buffered_handler = MemoryHandler(
+            1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        buffered_handler.setLevel(level)
+        handlers.append(buffered_handler)
+        atexit.register(buffered_handler.close)
+
+    # Emission happens on a background thread: the logger only enqueues
+    # records, so log calls never block on console/file I/O
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     return logger
 
 
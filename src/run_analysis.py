@@ -8,11 +8,14 @@ This script runs the complete analysis pipeline:
 4. Report generation
 """
 
+import logging
 import os
 import sys
 
-# Add src directory to path
-sys.path.insert(0, os.path.dirname(__file__))
+# Add src directory to path only when run as a script; package imports
+# resolve relatively and don't need the hack
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(__file__))
 
 try:
     from .data_collection import RoboticsDataCollector
@@ -29,91 +32,94 @@ except ImportError:
     from logger_config import logger
     from config import config
 
+# Banner strings built once instead of per run
+_RULE = "=" * 80
+_DASH = "-" * 80
+
+# Console banners go through a dedicated bare-message logger, replacing
+# the paired logger.info(...) + print(...) calls that formatted and
+# wrote every message twice
+ui = logging.getLogger("robotics_2026.ui")
+if not ui.handlers:
+    _ui_handler = logging.StreamHandler(sys.stdout)
+    _ui_handler.setFormatter(logging.Formatter("%(message)s"))
+    ui.addHandler(_ui_handler)
+    ui.setLevel(logging.INFO)
+    ui.propagate = False
+
 
 def main():
     """Run the complete analysis pipeline."""
-    logger.info("=" * 80)
-    logger.info("ROBOTICS INDUSTRY PROJECTION ANALYSIS FOR 2026")
-    logger.info("=" * 80)
-    print("=" * 80)
-    print("ROBOTICS INDUSTRY PROJECTION ANALYSIS FOR 2026")
-    print("=" * 80)
-    print()
-    
+    config.ensure_directories()
+    ui.info(_RULE)
+    ui.info("ROBOTICS INDUSTRY PROJECTION ANALYSIS FOR 2026")
+    ui.info(_RULE)
+    ui.info("")
+
     # Step 1: Data Collection
-    logger.info("STEP 1: Data Collection and Processing")
-    print("STEP 1: Data Collection and Processing")
-    print("-" * 80)
+    ui.info("STEP 1: Data Collection and Processing")
+    ui.info(_DASH)
     collector = RoboticsDataCollector(config)
     global_df, regional_df, installations_df = collector.generate_historical_data()
-    logger.info(f"Historical data loaded: {len(global_df)} years of data")
-    print(f"[OK] Historical data loaded: {len(global_df)} years of data")
-    print()
-    
+    ui.info("[OK] Historical data loaded: %d years of data", len(global_df))
+    ui.info("")
+
     # Step 2: Analysis and Projections
-    logger.info("STEP 2: Generating 2026 Projections")
-    print("STEP 2: Generating 2026 Projections")
-    print("-" * 80)
+    ui.info("STEP 2: Generating 2026 Projections")
+    ui.info(_DASH)
     analyzer = RoboticsProjectionAnalyzer(config)
     projections = analyzer.generate_2026_projections()
-    logger.info("Projections generated using ensemble methods")
-    print("[OK] Projections generated using ensemble methods")
-    print()
-    
+    ui.info("[OK] Projections generated using ensemble methods")
+    ui.info("")
+
     # Step 3: Save Projections
-    logger.info("STEP 3: Saving Projections")
-    print("STEP 3: Saving Projections")
-    print("-" * 80)
+    ui.info("STEP 3: Saving Projections")
+    ui.info(_DASH)
     projection_df = analyzer.save_projections(projections)
-    logger.info("Projections saved to CSV")
-    print("[OK] Projections saved to CSV")
-    print()
-    
+    ui.info("[OK] Projections saved to CSV")
+    ui.info("")
+
     # Step 4: Generate Report
-    logger.info("STEP 4: Generating Report")
-    print("STEP 4: Generating Report")
-    print("-" * 80)
+    ui.info("STEP 4: Generating Report")
+    ui.info(_DASH)
     report = analyzer.create_projection_report(projections)
-    print(report)
-    
+    ui.info(report)
+
     # Save report
     report_path = config.get_report_path(config.REPORT_FILE)
     with open(report_path, 'w', encoding='utf-8') as f:
         f.write(report)
-    logger.info(f"Report saved to: {report_path}")
-    print(f"\n[OK] Report saved to: {report_path}")
-    print()
-    
+    logger.info("Report saved to: %s", report_path)
+    ui.info("\n[OK] Report saved to: %s", report_path)
+    ui.info("")
+
     # Step 5: Create Visualizations
-    logger.info("STEP 5: Creating Visualizations")
-    print("STEP 5: Creating Visualizations")
-    print("-" * 80)
+    ui.info("STEP 5: Creating Visualizations")
+    ui.info(_DASH)
     visualizer = RoboticsVisualizer(config)
     visualizer.create_all_visualizations()
     logger.info("Visualizations created")
-    print()
-    
+    ui.info("")
+
     # Step 6: Create Interactive Dashboards
-    logger.info("STEP 6: Creating Interactive Dashboards")
-    print("STEP 6: Creating Interactive Dashboards")
-    print("-" * 80)
+    ui.info("STEP 6: Creating Interactive Dashboards")
+    ui.info(_DASH)
     dashboard = RoboticsDashboard(config)
     dashboard.save_dashboard('comprehensive')
     dashboard.save_dashboard('executive')
     logger.info("Dashboards created")
-    print()
-    
-    print("=" * 80)
-    print("ANALYSIS COMPLETE!")
-    print("=" * 80)
-    print("\nOutput files:")
-    print(f"  - Projections CSV: data/processed/projections_2026.csv")
-    print(f"  - Report: outputs/reports/projection_report_2026.txt")
-    print(f"  - Visualizations: outputs/figures/")
-    print(f"  - Interactive Dashboards: outputs/figures/robotics_dashboard_*.html")
-    print()
+    ui.info("")
+
+    ui.info(_RULE)
+    ui.info("ANALYSIS COMPLETE!")
+    ui.info(_RULE)
+    ui.info("\nOutput files:")
+    ui.info("  - Projections CSV: data/processed/projections_2026.csv")
+    ui.info("  - Report: outputs/reports/projection_report_2026.txt")
+    ui.info("  - Visualizations: outputs/figures/")
+    ui.info("  - Interactive Dashboards: outputs/figures/robotics_dashboard_*.html")
+    ui.info("")
 
 
 if __name__ == "__main__":
     main()
-
@@ -14,19 +14,23 @@ from data_collection import RoboticsDataCollector
 from config import config
 
 
+@pytest.fixture(scope="module")
+def collector():
+    """One shared collector for the module; the tests only read from it."""
+    return RoboticsDataCollector()
+
+
 class TestRoboticsDataCollector:
     """Test cases for RoboticsDataCollector."""
     
-    def test_initialization(self):
+    def test_initialization(self, collector):
         """Test collector initialization."""
-        collector = RoboticsDataCollector()
         assert collector.config is not None
         assert collector.raw_dir.exists()
         assert collector.processed_dir.exists()
     
-    def test_generate_historical_data(self):
+    def test_generate_historical_data(self, collector):
         """Test historical data generation."""
-        collector = RoboticsDataCollector()
         global_df, regional_df, installations_df = collector.generate_historical_data()
         
         # Check dataframes are created
@@ -45,9 +49,8 @@ class TestRoboticsDataCollector:
         assert global_df['year'].min() == 2015
         assert global_df['year'].max() == 2024
     
-    def test_load_data(self):
+    def test_load_data(self, collector):
         """Test data loading."""
-        collector = RoboticsDataCollector()
         global_df, regional_df, installations_df = collector.load_data()
         
         assert isinstance(global_df, pd.DataFrame)
@@ -55,9 +58,8 @@ class TestRoboticsDataCollector:
         assert isinstance(installations_df, pd.DataFrame)
         assert len(global_df) > 0
     
-    def test_calculate_growth_rates(self):
+    def test_calculate_growth_rates(self, collector):
         """Test growth rate calculation."""
-        collector = RoboticsDataCollector()
         df = pd.DataFrame({
             'year': [2020, 2021, 2022],
             'value': [100, 110, 121]
@@ -65,12 +67,11 @@ class TestRoboticsDataCollector:
         
         result = collector.calculate_growth_rates(df, 'value')
         assert 'growth_rate' in result.columns
-        assert 'cagr' in result.columns
+        assert 'cagr' in result.attrs
         assert not result['growth_rate'].isna().all()
     
-    def test_calculate_growth_rates_error(self):
+    def test_calculate_growth_rates_error(self, collector):
         """Test growth rate calculation with invalid input."""
-        collector = RoboticsDataCollector()
         df = pd.DataFrame({'year': [2020], 'value': [100]})
         
         with pytest.raises(ValueError):